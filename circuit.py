@@ -0,0 +1,105 @@
+"""
+Bit-parallel logic circuits for PyLogicTools.
+
+A circuit is a stack of layers of two-input gates. Each gate is stored as a
+4-bit operator id, two per byte, and the wires between layers are derived
+from a seed, so a gate costs half a byte. Values are bit-packed uint64 words,
+so every gate is evaluated for 64 samples at once.
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+from .logic_gates import GATE_FN
+
+
+Circuit = namedtuple('Circuit', ['num_inputs', 'layer_sizes', 'packed_ops', 'seed'])
+
+
+def pack_ops(op_ids):
+    """Pack 4-bit operator ids two per byte, first id in the low nibble."""
+    op_ids = np.asarray(op_ids, dtype=np.uint8)
+    if op_ids.size and op_ids.max() > 15:
+        raise ValueError("operator ids must be between 0 and 15")
+    if len(op_ids) % 2:
+        op_ids = np.append(op_ids, np.uint8(0))
+    return op_ids[0::2] | (op_ids[1::2] << 4)
+
+
+def unpack_ops(packed, count):
+    """Unpack the first ``count`` operator ids from pack_ops output."""
+    op_ids = np.empty(2 * len(packed), dtype=np.uint8)
+    op_ids[0::2] = packed & 0x0F
+    op_ids[1::2] = packed >> 4
+    return op_ids[:count]
+
+
+def make_circuit(num_inputs, layer_sizes, op_ids, seed=0):
+    """
+    Build a circuit from the operator id of every gate.
+    
+    Args:
+        num_inputs (int): Number of circuit inputs
+        layer_sizes (list): Number of gates in each layer
+        op_ids (list): Operator id of every gate, layer by layer (see GATE_IDS)
+        seed (int): Seed the gate wiring is derived from
+        
+    Returns:
+        Circuit: Compact circuit description
+        
+    Examples:
+        >>> circuit = make_circuit(2, [3, 1], [1, 6, 7, 14])  # AND, XOR, OR, NAND
+    """
+    layer_sizes = tuple(layer_sizes)
+    if len(op_ids) != sum(layer_sizes):
+        raise ValueError("need one operator id per gate")
+    return Circuit(num_inputs, layer_sizes, pack_ops(op_ids), seed)
+
+
+def layer_wiring(circuit, layer):
+    """
+    Input wires of every gate in a layer, derived from the circuit seed.
+    
+    Returns:
+        tuple: (lhs, rhs) index arrays into the previous layer's outputs
+    """
+    width = circuit.num_inputs if layer == 0 else circuit.layer_sizes[layer - 1]
+    size = circuit.layer_sizes[layer]
+    rng = np.random.default_rng((circuit.seed, layer))
+    return rng.integers(0, width, size), rng.integers(0, width, size)
+
+
+def simulate(circuit, inputs):
+    """
+    Evaluate a circuit on bit-packed inputs.
+    
+    Gates of a layer that share an operator are evaluated together, so each
+    layer costs at most 16 vectorized operations.
+    
+    Args:
+        circuit (Circuit): Circuit to evaluate
+        inputs: uint64 values of shape (num_inputs,) or (num_inputs, words),
+            each bit being one sample
+        
+    Returns:
+        numpy.ndarray: Outputs of the last layer, packed the same way
+    """
+    values = np.asarray(inputs, dtype=np.uint64)
+    if len(values) != circuit.num_inputs:
+        raise ValueError(f"expected {circuit.num_inputs} inputs, got {len(values)}")
+    
+    op_ids = unpack_ops(circuit.packed_ops, sum(circuit.layer_sizes))
+    start = 0
+    for layer, size in enumerate(circuit.layer_sizes):
+        lhs, rhs = layer_wiring(circuit, layer)
+        layer_ops = op_ids[start:start + size]
+        start += size
+        
+        out = np.empty((size,) + values.shape[1:], dtype=np.uint64)
+        for op_id in np.unique(layer_ops):
+            gates = layer_ops == op_id
+            out[gates] = GATE_FN[op_id](values[lhs[gates]], values[rhs[gates]])
+        values = out
+    
+    return values
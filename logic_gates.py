@@ -1,14 +1,162 @@
 """
 Basic logic gate operations for PyLogicTools.
 Simple functions for AND, OR, NOT, XOR, NAND, and NOR operations.
+
+Each gate also accepts NumPy arrays, in which case it works element-wise
+through the bit-packed ``*_bits`` functions below.
 """
 
-def AND(*inputs):
+from functools import reduce
+import operator
+
+import numpy as np
+
+
+# Mask used to keep inverted Python ints inside a 64-bit word
+WORD_MASK = (1 << 64) - 1
+
+# Default for gate arguments that were not passed
+_MISSING = object()
+
+# 4-bit operator ids of the two-input gates. Read MSB first, the id is the
+# gate's output for the inputs 00, 01, 10 and 11.
+GATE_IDS = {
+    'AND': 0b0001,
+    'XOR': 0b0110,
+    'OR': 0b0111,
+    'NOR': 0b1000,
+    'XNOR': 0b1001,
+    'NAND': 0b1110,
+}
+
+
+def _invert(value, mask=WORD_MASK):
+    """Bitwise NOT that stays within ``mask`` for Python ints."""
+    if isinstance(value, np.ndarray):
+        return ~value  # dtype already bounds the width
+    return ~value & mask
+
+
+def AND_bits(*inputs, mask=WORD_MASK):
+    """
+    Bitwise AND of bit-packed inputs.
+    
+    Every bit of an input is one sample, so a single call evaluates the gate
+    for 64 samples per uint64 word.
+    
+    Args:
+        *inputs: Python ints or NumPy integer/bool arrays
+        mask (int): Word mask for Python ints (default 64 bits)
+        
+    Returns:
+        int or numpy.ndarray: Bitwise AND of all inputs
+        
+    Examples:
+        >>> AND_bits(0b1100, 0b1010)
+        8
+    """
+    if not inputs:
+        return mask
+    return reduce(operator.and_, inputs)
+
+
+def OR_bits(*inputs, mask=WORD_MASK):
+    """
+    Bitwise OR of bit-packed inputs.
+    
+    Examples:
+        >>> OR_bits(0b1100, 0b1010)
+        14
+    """
+    if not inputs:
+        return 0
+    return reduce(operator.or_, inputs)
+
+
+def NOT_bits(input_val, mask=WORD_MASK):
+    """
+    Bitwise NOT of a bit-packed input.
+    
+    Examples:
+        >>> NOT_bits(0b1100, mask=0b1111)
+        3
+    """
+    return _invert(input_val, mask)
+
+
+def XOR_bits(*inputs, mask=WORD_MASK):
+    """
+    Bitwise XOR of bit-packed inputs.
+    
+    Examples:
+        >>> XOR_bits(0b1100, 0b1010)
+        6
+    """
+    if not inputs:
+        return 0
+    return reduce(operator.xor, inputs)
+
+
+def NAND_bits(*inputs, mask=WORD_MASK):
+    """
+    Bitwise NAND of bit-packed inputs.
+    
+    Examples:
+        >>> NAND_bits(0b1100, 0b1010, mask=0b1111)
+        7
+    """
+    return _invert(AND_bits(*inputs, mask=mask), mask)
+
+
+def NOR_bits(*inputs, mask=WORD_MASK):
+    """
+    Bitwise NOR of bit-packed inputs.
+    
+    Examples:
+        >>> NOR_bits(0b1100, 0b1010, mask=0b1111)
+        1
+    """
+    return _invert(OR_bits(*inputs, mask=mask), mask)
+
+
+def XNOR_bits(*inputs, mask=WORD_MASK):
+    """
+    Bitwise XNOR of bit-packed inputs.
+    
+    Examples:
+        >>> XNOR_bits(0b1100, 0b1010, mask=0b1111)
+        9
+    """
+    return _invert(XOR_bits(*inputs, mask=mask), mask)
+
+
+# Bitwise function of every two-input gate, indexed by GATE_IDS operator id
+GATE_FN = (
+    lambda a, b: a ^ a,               # 0: FALSE
+    lambda a, b: a & b,               # 1: AND
+    lambda a, b: a & _invert(b),      # 2: A AND NOT B
+    lambda a, b: a,                   # 3: A
+    lambda a, b: _invert(a) & b,      # 4: NOT A AND B
+    lambda a, b: b,                   # 5: B
+    lambda a, b: a ^ b,               # 6: XOR
+    lambda a, b: a | b,               # 7: OR
+    lambda a, b: _invert(a | b),      # 8: NOR
+    lambda a, b: _invert(a ^ b),      # 9: XNOR
+    lambda a, b: _invert(b),          # 10: NOT B
+    lambda a, b: a | _invert(b),      # 11: A OR NOT B
+    lambda a, b: _invert(a),          # 12: NOT A
+    lambda a, b: _invert(a) | b,      # 13: NOT A OR B
+    lambda a, b: _invert(a & b),      # 14: NAND
+    lambda a, b: _invert(a ^ a),      # 15: TRUE
+)
+
+
+def AND(a=_MISSING, b=_MISSING, *rest):
     """
     Performs logical AND operation on multiple inputs.
     
     Args:
-        *inputs: Boolean values to AND together
+        a, b, *rest: Boolean values to AND together
         
     Returns:
         bool: True if all inputs are True, False otherwise
@@ -21,18 +169,31 @@ def AND(*inputs):
         >>> AND(True, True, True)
         True
     """
-    if not inputs:
-        return True  # Empty AND is True by convention
+    if b is _MISSING:
+        if a is _MISSING:
+            return True  # Empty AND is True by convention
+        return a if isinstance(a, np.ndarray) else bool(a)
+    
+    if isinstance(a, np.ndarray):
+        return AND_bits(a, b, *rest)
     
-    return all(inputs)
+    # Two inputs is by far the most common call
+    if not rest:
+        return bool(a) and bool(b)
+    if not (a and b):
+        return False
+    for x in rest:
+        if not x:
+            return False
+    return True
 
 
-def OR(*inputs):
+def OR(a=_MISSING, b=_MISSING, *rest):
     """
     Performs logical OR operation on multiple inputs.
     
     Args:
-        *inputs: Boolean values to OR together
+        a, b, *rest: Boolean values to OR together
         
     Returns:
         bool: True if any input is True, False if all are False
@@ -45,10 +206,23 @@ def OR(*inputs):
         >>> OR(False, False, True)
         True
     """
-    if not inputs:
-        return False  # Empty OR is False by convention
+    if b is _MISSING:
+        if a is _MISSING:
+            return False  # Empty OR is False by convention
+        return a if isinstance(a, np.ndarray) else bool(a)
+    
+    if isinstance(a, np.ndarray):
+        return OR_bits(a, b, *rest)
     
-    return any(inputs)
+    # Two inputs is by far the most common call
+    if not rest:
+        return bool(a) or bool(b)
+    if a or b:
+        return True
+    for x in rest:
+        if x:
+            return True
+    return False
 
 
 def NOT(input_val):
@@ -67,6 +241,9 @@ def NOT(input_val):
         >>> NOT(False)
         True
     """
+    if isinstance(input_val, np.ndarray):
+        return NOT_bits(input_val)
+    
     return not input_val
 
 
@@ -89,11 +266,15 @@ def XOR(*inputs):
         >>> XOR(True, True, True)
         True
     """
-    if not inputs:
-        return False
+    if inputs and isinstance(inputs[0], np.ndarray):
+        return XOR_bits(*inputs)
     
-    true_count = sum(inputs)
-    return true_count % 2 == 1
+    # Toggle on every True input; faster than reducing or counting bits
+    odd = False
+    for x in inputs:
+        if x:
+            odd = not odd
+    return odd
 
 
 def NAND(*inputs):
@@ -112,7 +293,10 @@ def NAND(*inputs):
         >>> NAND(True, False)
         True
     """
-    return NOT(AND(*inputs))
+    if inputs and isinstance(inputs[0], np.ndarray):
+        return NAND_bits(*inputs)
+    
+    return not all(inputs)
 
 
 def NOR(*inputs):
@@ -131,7 +315,10 @@ def NOR(*inputs):
         >>> NOR(True, False)
         False
     """
-    return NOT(OR(*inputs))
+    if inputs and isinstance(inputs[0], np.ndarray):
+        return NOR_bits(*inputs)
+    
+    return not any(inputs)
 
 
 def XNOR(*inputs):
@@ -150,7 +337,14 @@ def XNOR(*inputs):
         >>> XNOR(True, False)
         False
     """
-    return NOT(XOR(*inputs))
+    if inputs and isinstance(inputs[0], np.ndarray):
+        return XNOR_bits(*inputs)
+    
+    even = True
+    for x in inputs:
+        if x:
+            even = not even
+    return even
 
 
 # Helper function for testing all gates
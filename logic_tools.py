@@ -21,8 +21,6 @@ import matplotlib.pyplot as plt
 import numpy as np
 
 # --- Configuration ---
-# Set the name for your temporary SPICE netlist file
-NETLIST_FILENAME = 'common_source_amp.sp'
 # Set the name for the simulation output file
 OUTPUT_FILENAME = 'simulation_output.csv'
 
@@ -77,26 +75,26 @@ M1 V_out V_in 0 0 nmos_model L=1u W=10u
     netlist = model_definition + circuit_description
     return netlist
 
-def run_simulation(netlist_path):
+def run_simulation(netlist):
     """
     Runs the SPICE simulation using Ngspice.
 
+    The netlist is piped to ngspice through stdin, so it never has to be
+    written to disk.
+
     Args:
-        netlist_path (str): The path to the SPICE netlist file.
+        netlist (str): The SPICE netlist content.
 
     Returns:
         tuple: A tuple containing the stdout and stderr from the Ngspice process.
-               Returns (None, None) if the file doesn't exist.
     """
-    if not os.path.exists(netlist_path):
-        print(f"Error: Netlist file not found at {netlist_path}")
-        return None, None
-
-    print(f"Running simulation with ngspice on {netlist_path}...")
+    print("Running simulation with ngspice...")
     try:
-        # Use subprocess to call ngspice with the netlist file
+        # Use subprocess to feed the netlist to ngspice on stdin; with no
+        # file argument, batch mode reads the circuit from stdin
         result = subprocess.run(
-            ['ngspice', '-b', netlist_path],
+            ['ngspice', '-b'],
+            input=netlist,
             capture_output=True,
             text=True,
             check=True
@@ -124,13 +122,15 @@ def parse_and_plot_results(output_path):
     print(f"Parsing and plotting results from {output_path}...")
     try:
         # Load data from the CSV file.
-        # The first row is headers, so we skip it.
-        data = np.genfromtxt(output_path, delimiter=',', names=True)
+        # The first row is headers, so we skip it. The data has no missing
+        # values, so np.loadtxt is enough, and float32 is plenty for plotting.
+        # ndmin=2 keeps a single data row two-dimensional.
+        data = np.loadtxt(output_path, delimiter=',', skiprows=1,
+                          dtype=np.float32, ndmin=2)
         
         # The columns are defined in the .control block as V_in and V_out.
-        # The names from np.genfromtxt will be 'V_in' and 'V_out'.
-        input_voltage = data['V_in']
-        output_voltage = data['V_out']
+        input_voltage = data[:, 0]
+        output_voltage = data[:, 1]
         
         # Create a plot using matplotlib
         plt.figure(figsize=(10, 6))
@@ -159,15 +159,12 @@ def cleanup(file_list):
 
 # --- Main execution block ---
 if __name__ == '__main__':
-    # 1. Generate the SPICE netlist and write it to a file
+    # 1. Generate the SPICE netlist
     netlist_content = generate_netlist()
-    with open(NETLIST_FILENAME, 'w') as f:
-        f.write(netlist_content)
-    print(f"Netlist saved to {NETLIST_FILENAME}")
 
     # 2. Run the simulation
     # The run_simulation function will handle calling ngspice and checking for errors.
-    stdout, stderr = run_simulation(NETLIST_FILENAME)
+    stdout, stderr = run_simulation(netlist_content)
 
     # 3. Check if the simulation was successful and if the output file was created
     if stdout is not None and os.path.exists(OUTPUT_FILENAME):
@@ -177,5 +174,5 @@ if __name__ == '__main__':
         print("Skipping plotting due to simulation error or missing output file.")
 
     # 5. Clean up temporary files
-    cleanup([NETLIST_FILENAME, OUTPUT_FILENAME])
+    cleanup([OUTPUT_FILENAME])
 
@@ -4,11 +4,11 @@ Convert between binary, decimal, and hexadecimal.
 """
 
 
+# Binary and hex formatting is linear in the number of digits, so the
+# format specs below stay the fastest option even for very large ints.
 def decimal_to_binary(decimal):
     """Convert decimal to binary string."""
-    if decimal == 0:
-        return "0"
-    return bin(decimal)[2:]  # Remove '0b' prefix
+    return f"{decimal:b}"
 
 
 def binary_to_decimal(binary):
@@ -18,7 +18,7 @@ def binary_to_decimal(binary):
 
 def decimal_to_hex(decimal):
     """Convert decimal to hexadecimal string."""
-    return hex(decimal)[2:].upper()  # Remove '0x' prefix, uppercase
+    return f"{decimal:X}"
 
 
 def hex_to_decimal(hex_val):
@@ -43,6 +43,11 @@ def pad_binary(binary, bits=8):
     return binary.zfill(bits)
 
 
+def decimal_to_padded_binary(decimal, bits=8):
+    """Convert decimal to binary string with leading zeros."""
+    return f"{decimal:0{bits}b}"
+
+
 def show_conversions(number, base='decimal'):
     """Show number in all three systems."""
     if base == 'decimal':
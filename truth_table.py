@@ -2,70 +2,448 @@
 Simple truth table generator for PyLogicTools.
 """
 
+import builtins
+import sys
+from collections import OrderedDict, namedtuple
 from itertools import product
-from .logic_gates import AND, OR, NOT, XOR
+import types
 
+import numpy as np
 
-def generate_table(variables, expression_func):
+try:
+    from numba import njit
+except ImportError:  # numba is optional, only needed for generate_table_njit
+    njit = None
+
+from .logic_gates import AND, OR, NOT, XOR, NAND, NOR, XNOR, GATE_IDS
+
+
+# Above this many variables the table is built row by row
+MAX_VECTORIZED_VARS = 20
+
+# Names available to string expressions in generate_table_expr
+_EXPR_GLOBALS = {
+    '__builtins__': {},
+    'AND': AND,
+    'OR': OR,
+    'NOT': NOT,
+    'XOR': XOR,
+    'NAND': NAND,
+    'NOR': NOR,
+    'XNOR': XNOR,
+}
+
+# Truth table of every two-input gate, indexed by 4-bit operator id
+_GATE_TABLES = tuple(
+    tuple((a, b, (op_id >> (3 - 2 * a - b)) & 1) for a in (0, 1) for b in (0, 1))
+    for op_id in range(16)
+)
+
+_NOT_TABLE = ((0, 1), (1, 0))
+
+# Truth tables already generated, keyed by _cache_key(), least recently
+# used first. Tables above MAX_CACHED_VARS variables are never stored, so
+# the cache holds at most _TT_CACHE_SIZE tables of about 1 MB each.
+_TT_CACHE = OrderedDict()
+_TT_CACHE_SIZE = 32
+MAX_CACHED_VARS = 16
+
+# Globals an expression may read and still be cached: this package's gates
+# and a few pure builtins. Any other function could read mutable state.
+_STATIC_GLOBALS = frozenset([
+    AND, OR, NOT, XOR, NAND, NOR, XNOR,
+    abs, all, any, bool, int, len, max, min, sum,
+])
+
+
+# Row orders supported by generate_table
+ROW_ORDERS = ('binary', 'gray')
+
+
+def gray_iter(num_vars):
+    """
+    Yield every input combination in Gray-code order.
+    
+    Consecutive rows differ in exactly one variable.
+    
+    Examples:
+        >>> list(gray_iter(2))
+        [(0, 0), (0, 1), (1, 1), (1, 0)]
+    """
+    shifts = range(num_vars - 1, -1, -1)
+    for i in range(1 << num_vars):
+        gray = i ^ (i >> 1)
+        yield tuple([(gray >> shift) & 1 for shift in shifts])
+
+
+def _fill_input_columns(out, num_vars, order='binary'):
+    """
+    Write every input combination into ``out``, first variable as MSB.
+    
+    Columns are filled one at a time so only a single column of
+    temporaries exists, never the whole shifted matrix.
+    """
+    index = np.arange(1 << num_vars, dtype=np.uint32)
+    if order == 'gray':
+        index ^= index >> 1
+    for k in range(num_vars):
+        np.bitwise_and(index >> (num_vars - 1 - k), 1,
+                       out=out[:, k], casting='unsafe')
+
+
+def _input_columns(num_vars, order='binary'):
+    """Boolean matrix of every input combination, first variable as MSB."""
+    columns = np.empty((1 << num_vars, num_vars), dtype=np.bool_)
+    _fill_input_columns(columns, num_vars, order)
+    return columns
+
+
+def _is_vectorizable(result, num_rows):
+    """Check that a function returned one value per truth table row."""
+    return isinstance(result, np.ndarray) and result.shape == (num_rows,)
+
+
+def _evaluate_columns(num_vars, expression_func, order='binary'):
+    """
+    Evaluate the expression on whole input columns at once.
+    
+    Returns:
+        tuple: (inputs, result) arrays, or None if the expression
+        cannot be evaluated on NumPy arrays
+    """
+    if not 0 < num_vars <= MAX_VECTORIZED_VARS:
+        return None
+    
+    columns = _input_columns(num_vars, order)
+    try:
+        result = expression_func(*columns.T)
+    except Exception:
+        return None
+    if not _is_vectorizable(result, len(columns)):
+        return None
+    return columns, result
+
+
+def _generate_rows(num_vars, expression_func, order='binary'):
+    """
+    Evaluate the expression one row at a time.
+    
+    Returns:
+        numpy.ndarray: Preallocated uint8 table, inputs then result
+    """
+    table = np.empty((1 << num_vars, num_vars + 1), dtype=np.uint8)
+    _fill_input_columns(table, num_vars, order)
+    if order == 'gray':
+        combinations = gray_iter(num_vars)
+    else:
+        combinations = product((0, 1), repeat=num_vars)
+    table[:, num_vars] = np.fromiter(
+        (1 if expression_func(*combo) else 0 for combo in combinations),
+        dtype=np.uint8,
+        count=len(table),
+    )
+    return table
+
+
+def _cache_key(num_vars, expression_func, order='binary'):
+    """
+    Build a cache key from the expression's code and the globals it reads.
+    
+    Returns None when the result could change between calls: anything but
+    a plain function (bound methods depend on ``self``), closures, default
+    arguments, nested functions, attribute reads, or globals other than
+    the gates and pure builtins in _STATIC_GLOBALS.
+    """
+    if type(expression_func) is not types.FunctionType:
+        return None
+    code = expression_func.__code__
+    if expression_func.__closure__:
+        return None
+    if expression_func.__defaults__ or expression_func.__kwdefaults__:
+        return None
+    if any(isinstance(const, types.CodeType) for const in code.co_consts):
+        return None
+    
+    func_globals = expression_func.__globals__
+    used = []
+    for name in code.co_names:
+        if name in func_globals:
+            value = func_globals[name]
+        elif hasattr(builtins, name):
+            value = getattr(builtins, name)
+        else:
+            return None  # attribute read, e.g. the `flip` in `cfg.flip`
+        if value not in _STATIC_GLOBALS:
+            return None
+        used.append((name, value))
+    
+    return num_vars, order, code, tuple(used)
+
+
+def clear_truth_table_cache():
+    """Forget all truth tables cached by generate_table."""
+    _TT_CACHE.clear()
+
+
+def generate_table(variables, expression_func, order='binary', vectorize=False,
+                   cache=False):
     """
     Generate truth table for given variables and expression.
     
+    With ``vectorize=True`` the expression is called once with whole columns
+    of inputs as NumPy bool arrays. Only use it for expressions built from
+    the logic gates or from the &, |, ^ and ~ operators: arithmetic such as
+    ``a + b`` saturates on bool arrays and gives wrong results. If the call
+    raises or does not return one value per row, the table is built row by
+    row instead.
+    
+    With ``cache=True`` tables built row by row are remembered, so repeated
+    calls with the same expression skip the evaluation. Only plain
+    functions that call nothing but the logic gates and pure builtins are
+    cached, up to MAX_CACHED_VARS variables. Vectorized tables are cheap enough to rebuild and are not
+    cached. See clear_truth_table_cache().
+    
     Args:
         variables (list): Variable names like ['A', 'B']
         expression_func (function): Function that takes values and returns result
+        order (str): 'binary' for counting order, or 'gray' so consecutive
+            rows differ in a single input
+        vectorize (bool): Evaluate the expression on whole input columns
+        cache (bool): Reuse the table from an earlier identical call
         
     Returns:
         list: Truth table rows
     """
+    if order not in ROW_ORDERS:
+        raise ValueError(f"order must be one of {ROW_ORDERS}, got {order!r}")
     num_vars = len(variables)
-    combinations = list(product([0, 1], repeat=num_vars))
     
-    table = []
-    for combo in combinations:
-        result = expression_func(*combo)
-        row = list(combo) + [int(result)]
-        table.append(row)
+    if vectorize:
+        evaluated = _evaluate_columns(num_vars, expression_func, order)
+        if evaluated is not None:
+            columns, result = evaluated
+            table = np.empty((len(columns), num_vars + 1), dtype=np.uint8)
+            table[:, :num_vars] = columns
+            table[:, num_vars] = result.astype(np.bool_)
+            return table.tolist()
     
-    return table
+    key = None
+    if cache and num_vars <= MAX_CACHED_VARS:
+        key = _cache_key(num_vars, expression_func, order)
+    cached = _TT_CACHE.get(key) if key is not None else None
+    if cached is not None:
+        _TT_CACHE.move_to_end(key)
+        return cached.tolist()
+    
+    table = _generate_rows(num_vars, expression_func, order)
+    if key is not None:
+        table.flags.writeable = False
+        _TT_CACHE[key] = table
+        if len(_TT_CACHE) > _TT_CACHE_SIZE:
+            _TT_CACHE.popitem(last=False)
+    return table.tolist()
+
+
+def generate_table_expr(variables, expr_str, vectorize=False):
+    """
+    Generate truth table for an expression given as a string.
+    
+    The string is compiled once and the code object is reused for every
+    row, so it is never re-parsed.
+    
+    Args:
+        variables (list): Variable names like ['A', 'B']
+        expr_str (str): Python expression using the variables and the
+            gates AND, OR, NOT, XOR, NAND, NOR and XNOR
+        vectorize (bool): Evaluate on whole input columns, see generate_table
+        
+    Returns:
+        list: Truth table rows
+        
+    Examples:
+        >>> generate_table_expr(['A', 'B'], 'AND(A, NOT(B))')
+        [[0, 0, 0], [0, 1, 0], [1, 0, 1], [1, 1, 0]]
+    """
+    code = compile(expr_str, '<truth table>', 'eval')
+    
+    def expression_func(*values):
+        return eval(code, _EXPR_GLOBALS, dict(zip(variables, values)))
+    
+    return generate_table(variables, expression_func, vectorize=vectorize)
+
+
+def _table_columns(num_vars, expression_func, vectorize=False):
+    """Input and result columns as arrays, vectorized if requested."""
+    if vectorize:
+        evaluated = _evaluate_columns(num_vars, expression_func)
+        if evaluated is not None:
+            return evaluated
+    
+    table = _generate_rows(num_vars, expression_func)
+    return table[:, :num_vars], table[:, num_vars]
+
+
+# Truth table stored one bit per cell, eight rows per byte
+PackedTable = namedtuple('PackedTable', ['inputs', 'result', 'num_rows'])
+
+
+def generate_packed_table(variables, expression_func, vectorize=False):
+    """
+    Generate a truth table packed with np.packbits.
+    
+    Uses one bit per cell instead of a Python int, which makes tables with
+    many variables fit in memory.
+    
+    Args:
+        variables (list): Variable names like ['A', 'B']
+        expression_func (function): Function that takes values and returns result
+        vectorize (bool): Evaluate on whole input columns, see generate_table
+        
+    Returns:
+        PackedTable: Packed input columns, packed result column and row count
+    """
+    columns, result = _table_columns(len(variables), expression_func, vectorize)
+    return PackedTable(
+        np.packbits(columns.astype(np.bool_), axis=0),
+        np.packbits(result.astype(np.bool_)),
+        len(columns),
+    )
+
+
+def unpack_row(packed, i):
+    """
+    Read row ``i`` of a PackedTable.
+    
+    Returns:
+        list: Input bits followed by the result bit
+    """
+    byte, bit = divmod(i, 8)
+    shift = 7 - bit
+    row = ((packed.inputs[byte] >> shift) & 1).tolist()
+    row.append(int((packed.result[byte] >> shift) & 1))
+    return row
+
+
+def generate_table_soa(variables, expression_func, vectorize=False):
+    """
+    Generate truth table as one array per column.
+    
+    Each column is a contiguous uint8 array, so counting or filtering rows
+    is a single NumPy operation instead of a loop over row lists.
+    
+    Args:
+        variables (list): Variable names like ['A', 'B']
+        expression_func (function): Function that takes values and returns result
+        vectorize (bool): Evaluate on whole input columns, see generate_table
+        
+    Returns:
+        dict: Column arrays keyed by variable name, plus 'Result'
+        
+    Examples:
+        >>> soa = generate_table_soa(['A', 'B'], lambda a, b: AND(a, b))
+        >>> int(soa['Result'].sum())
+        1
+    """
+    if 'Result' in variables:
+        raise ValueError("'Result' is reserved for the output column")
+    
+    columns, result = _table_columns(len(variables), expression_func, vectorize)
+    soa = {name: columns[:, k].astype(np.uint8) for k, name in enumerate(variables)}
+    soa['Result'] = result.astype(np.uint8)
+    return soa
+
+
+def rows_view(soa):
+    """Iterate over a column table from generate_table_soa as row tuples."""
+    return zip(*(column.tolist() for column in soa.values()))
+
+
+if njit is not None:
+    # Not cached on disk: the kernel is specialized per expression, so every
+    # distinct expression would add a cache file that is never reused
+    @njit
+    def _eval_rows(num_vars, out, expression_func):
+        """Fill ``out`` with every input row and its result."""
+        for i in range(1 << num_vars):
+            for k in range(num_vars):
+                out[i, k] = np.uint8((i >> (num_vars - 1 - k)) & 1)
+            out[i, num_vars] = np.uint8(1 if expression_func(out[i, :num_vars]) else 0)
+
+
+def generate_table_njit(variables, njit_expression_func):
+    """
+    Generate truth table with a Numba-compiled expression.
+    
+    Useful for expressions with branches that cannot be evaluated on NumPy
+    arrays. Requires numba.
+    
+    Args:
+        variables (list): Variable names like ['A', 'B']
+        njit_expression_func (function): @njit function taking one uint8
+            array with the input bits of a row and returning the result
+        
+    Returns:
+        numpy.ndarray: uint8 table with one row per input combination
+        
+    Examples:
+        >>> @njit
+        ... def expr(row):
+        ...     return row[0] if row[1] else not row[0]
+        >>> table = generate_table_njit(['A', 'B'], expr)
+    """
+    if njit is None:
+        raise ImportError("generate_table_njit requires numba")
+    
+    num_vars = len(variables)
+    out = np.empty((1 << num_vars, num_vars + 1), dtype=np.uint8)
+    _eval_rows(num_vars, out, njit_expression_func)
+    return out
 
 
 def show_table(variables, table):
     """Display truth table in a nice format."""
     # Header
     header = " | ".join(variables) + " | Result"
-    print(header)
-    print("-" * len(header))
+    lines = [header, "-" * len(header)]
+    
+    # Packed and column tables are turned into rows lazily
+    rows = table
+    if isinstance(table, PackedTable):
+        rows = (unpack_row(table, i) for i in range(table.num_rows))
+    elif isinstance(table, dict):
+        rows = rows_view(table)
     
-    # Rows
-    for row in table:
-        row_str = " | ".join(map(str, row))
-        print(row_str)
+    # Rows, written in one go rather than one print per row
+    lines.extend(" | ".join(map(str, row)) for row in rows)
+    lines.append("")
+    sys.stdout.write("\n".join(lines))
 
 
-def and_table(var_names=['A', 'B']):
-    """Generate AND gate truth table."""
-    table = generate_table(var_names, lambda a, b: AND(a, b))
+def gate_table(op_id, var_names=['A', 'B']):
+    """Show the precomputed truth table of a two-input gate by operator id."""
+    table = [list(row) for row in _GATE_TABLES[op_id]]
     show_table(var_names, table)
     return table
 
 
+def and_table(var_names=['A', 'B']):
+    """Generate AND gate truth table."""
+    return gate_table(GATE_IDS['AND'], var_names)
+
+
 def or_table(var_names=['A', 'B']):
     """Generate OR gate truth table."""
-    table = generate_table(var_names, lambda a, b: OR(a, b))
-    show_table(var_names, table)
-    return table
+    return gate_table(GATE_IDS['OR'], var_names)
 
 
 def xor_table(var_names=['A', 'B']):
     """Generate XOR gate truth table."""
-    table = generate_table(var_names, lambda a, b: XOR(a, b))
-    show_table(var_names, table)
-    return table
+    return gate_table(GATE_IDS['XOR'], var_names)
 
 
 def not_table(var_names=['A']):
     """Generate NOT gate truth table."""
-    table = generate_table(var_names, lambda a: NOT(a))
+    table = [list(row) for row in _NOT_TABLE]
     show_table(var_names, table)
     return table
 